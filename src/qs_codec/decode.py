@@ -2,18 +2,28 @@
 
 import re
 import typing as t
+from copy import deepcopy
+from functools import lru_cache
 from math import isinf
 
-from regex import regex
-
 from .enums.charset import Charset
 from .enums.duplicates import Duplicates
 from .enums.sentinel import Sentinel
 from .models.decode_options import DecodeOptions
-from .models.undefined import Undefined
+from .models.undefined import UNDEFINED
 from .utils.utils import Utils
 
 
+_DOT_NOTATION_RE: t.Pattern[str] = re.compile(r"\.([^.[]+)")
+"""Matches a dot-notation segment (``.b`` in ``a.b``) so it can be rewritten as a bracket segment."""
+
+_NUMERIC_ENTITY_RE: t.Pattern[str] = re.compile(r"&#(\d+);")
+"""Matches an HTML numeric entity such as ``&#9786;``."""
+
+_MAX_CACHED_KEY_LENGTH: int = 256
+"""Keys longer than this are split without the segment cache, so it never holds on to large keys."""
+
+
 def decode(
     value: t.Optional[t.Union[str, t.Dict[str, t.Any]]],
     options: DecodeOptions = DecodeOptions(),
@@ -31,21 +41,28 @@ def decode(
     if not isinstance(value, (str, dict)):
         raise ValueError("The input must be a String or a Dict")
 
+    # A dict input is copied once up front, merging and compacting then work in place without touching the caller's data
     temp_obj: t.Optional[t.Dict[str, t.Any]] = (
-        _parse_query_string_values(value, options) if isinstance(value, str) else value
+        _parse_query_string_values(value, options) if isinstance(value, str) else deepcopy(value)
     )
 
     # Iterate over the keys and setup the new object
     if temp_obj:
         for key, val in temp_obj.items():
             new_obj: t.Any = _parse_keys(key, val, options, isinstance(value, str))
-            obj = Utils.merge(obj, new_obj, options)  # type: ignore [assignment]
+            # A top-level key seen for the first time needs no merging, so add it in place instead of copying obj
+            if type(new_obj) is dict and obj.keys().isdisjoint(new_obj):
+                obj.update(new_obj)
+            else:
+                obj = Utils.merge(obj, new_obj, options)  # type: ignore [assignment]
 
     return Utils.compact(obj)
 
 
 def _interpret_numeric_entities(value: str) -> str:
-    return re.sub(r"&#(\d+);", lambda match: chr(int(match.group(1))), value)
+    if "&#" not in value:
+        return value
+    return _NUMERIC_ENTITY_RE.sub(lambda match: chr(int(match.group(1))), value)
 
 
 def _parse_array_value(value: t.Any, options: DecodeOptions, current_list_length: int) -> t.Any:
@@ -69,25 +86,29 @@ def _parse_query_string_values(value: str, options: DecodeOptions) -> t.Dict[str
     obj: t.Dict[str, t.Any] = {}
 
     clean_str: str = value.replace("?", "", 1) if options.ignore_query_prefix else value
-    clean_str = clean_str.replace("%5B", "[").replace("%5b", "[").replace("%5D", "]").replace("%5d", "]")
+    # A single scan for "%5" lets the common case skip the four bracket rewrites
+    if "%5" in clean_str:
+        clean_str = clean_str.replace("%5B", "[").replace("%5b", "[").replace("%5D", "]").replace("%5d", "]")
     limit: t.Optional[int] = None if isinf(options.parameter_limit) else options.parameter_limit  # type: ignore [assignment]
 
     if limit is not None and limit <= 0:
         raise ValueError("Parameter limit must be a positive integer.")
 
     parts: t.List[str]
-    if isinstance(options.delimiter, re.Pattern):
+    if limit is None:
         parts = (
-            re.split(options.delimiter, clean_str)
-            if (limit is None) or not limit
-            else re.split(options.delimiter, clean_str)[: (limit + 1 if options.raise_on_limit_exceeded else limit)]
+            options.delimiter.split(clean_str)
+            if isinstance(options.delimiter, re.Pattern)
+            else clean_str.split(options.delimiter)
         )
     else:
+        # Stop splitting once enough parts were found, the unsplit remainder is then sliced off
+        max_parts: int = limit + 1 if options.raise_on_limit_exceeded else limit
         parts = (
-            clean_str.split(options.delimiter)
-            if (limit is None) or not limit
-            else clean_str.split(options.delimiter)[: (limit + 1 if options.raise_on_limit_exceeded else limit)]
-        )
+            options.delimiter.split(clean_str, max_parts)
+            if isinstance(options.delimiter, re.Pattern)
+            else clean_str.split(options.delimiter, max_parts)
+        )[:max_parts]
 
     if options.raise_on_limit_exceeded and (limit is not None) and len(parts) > limit:
         raise ValueError(f"Parameter limit exceeded: Only {limit} parameter{'' if limit == 1 else 's'} allowed.")
@@ -107,6 +128,12 @@ def _parse_query_string_values(value: str, options: DecodeOptions) -> t.Dict[str
                 skip_index = i
                 break
 
+    # Resolve the decoder once instead of looking it up on the options for every key and value
+    decoder: t.Callable[[t.Optional[str], t.Optional[Charset]], t.Any] = options.decoder
+
+    def decode_value(v: str) -> t.Any:
+        return decoder(v, charset)
+
     for i, _ in enumerate(parts):
         if i == skip_index:
             continue
@@ -118,17 +145,20 @@ def _parse_query_string_values(value: str, options: DecodeOptions) -> t.Dict[str
         key: str
         val: t.Union[t.List, t.Tuple, str, t.Any]
         if pos == -1:
-            key = options.decoder(part, charset)
+            key = decoder(part, charset)
             val = None if options.strict_null_handling else ""
         else:
-            key = options.decoder(part[:pos], charset)
+            key = decoder(part[:pos], charset)
+            # Only the first value is kept, so a duplicate's value need not be decoded unless it may exceed a limit
+            if options.duplicates == Duplicates.FIRST and key in obj and not options.raise_on_limit_exceeded:
+                continue
             val = Utils.apply(
                 _parse_array_value(
                     part[pos + 1 :],
                     options,
                     len(obj[key]) if key in obj and isinstance(obj[key], (list, tuple)) else 0,
                 ),
-                lambda v: options.decoder(v, charset),
+                decode_value,
             )
 
         if val and options.interpret_numeric_entities and charset == Charset.LATIN1:
@@ -162,27 +192,32 @@ def _parse_object(
         except ValueError:
             parent_key = None
 
-        if parent_key is not None and isinstance(val, (list, tuple)) and parent_key in dict(enumerate(val)):
+        if parent_key is not None and isinstance(val, (list, tuple)) and 0 <= parent_key < len(val):
             current_list_length = len(val[parent_key])
 
     leaf: t.Any = val if values_parsed else _parse_array_value(val, options, current_list_length)
 
+    # The options are read once per segment, so bind them to locals ahead of the loop
+    parse_lists: bool = options.parse_lists
+    decode_dot_in_keys: bool = options.decode_dot_in_keys
+    list_limit: int = options.list_limit
+
     i: int
     for i in reversed(range(len(chain))):
         obj: t.Optional[t.Union[t.Dict[str, t.Any], t.List[t.Any]]]
         root: str = chain[i]
 
-        if root == "[]" and options.parse_lists:
+        if root == "[]" and parse_lists:
             if options.allow_empty_lists and (leaf == "" or (options.strict_null_handling and leaf is None)):
                 obj = []
             else:
                 obj = list(leaf) if isinstance(leaf, (list, tuple)) else [leaf]
         else:
-            obj = dict()
+            obj = {}
 
             clean_root: str = root[1:-1] if root.startswith("[") and root.endswith("]") else root
 
-            decoded_root: str = clean_root.replace(r"%2E", ".") if options.decode_dot_in_keys else clean_root
+            decoded_root: str = clean_root.replace(r"%2E", ".") if decode_dot_in_keys else clean_root
 
             index: t.Optional[int]
             try:
@@ -190,17 +225,17 @@ def _parse_object(
             except (ValueError, TypeError):
                 index = None
 
-            if not options.parse_lists and decoded_root == "":
+            if not parse_lists and decoded_root == "":
                 obj = {"0": leaf}
             elif (
                 index is not None
                 and index >= 0
                 and root != decoded_root
                 and str(index) == decoded_root
-                and options.parse_lists
-                and index <= options.list_limit
+                and parse_lists
+                and index <= list_limit
             ):
-                obj = [Undefined() for _ in range(index + 1)]
+                obj = [UNDEFINED] * (index + 1)
                 obj[index] = leaf
             else:
                 obj[str(index) if index is not None else decoded_root] = leaf
@@ -214,32 +249,74 @@ def _parse_keys(given_key: t.Optional[str], val: t.Any, options: DecodeOptions,
     if not given_key:
         return
 
-    # Transform dot notation to bracket notation
-    key: str = re.sub(r"\.([^.[]+)", r"[\1]", given_key) if options.allow_dots else given_key
+    split = _split_key_into_segments_cached if len(given_key) <= _MAX_CACHED_KEY_LENGTH else _split_key_into_segments
+    keys: t.Tuple[str, ...] = split(given_key, options.allow_dots, options.depth, options.strict_depth)
+
+    return _parse_object(keys, val, options, values_parsed)
 
-    # The regex chunks
-    brackets: regex.Pattern[str] = regex.compile(r"\[(?:[^\[\]]|(?R))*\]")
+
+def _split_key_into_segments(given_key: str, allow_dots: bool, depth: int, strict_depth: bool) -> t.Tuple[str, ...]:
+    """Split a key into its parent and bracket segments, e.g. ``a[b][c]`` into ``("a", "[b]", "[c]")``."""
+    # Transform dot notation to bracket notation
+    key: str = _DOT_NOTATION_RE.sub(r"[\1]", given_key) if allow_dots else given_key
 
     # Get the parent
-    segment: t.Optional[regex.Match] = brackets.search(key) if options.depth > 0 else None
-    parent: str = key[0 : segment.start()] if segment is not None else key
+    segment: t.Optional[t.Tuple[int, int]] = _find_bracket_segment(key, 0) if depth > 0 else None
+    parent: str = key[0 : segment[0]] if segment is not None else key
 
     # Stash the parent if it exists
     keys: t.List[str] = [parent] if parent else []
 
     # Loop through children appending to the array until we hit depth
     i: int = 0
-    while options.depth > 0 and (segment := brackets.search(key)) is not None and i < options.depth:
+    pos: int = 0
+    while depth > 0 and (segment := _find_bracket_segment(key, pos)) is not None and i < depth:
         i += 1
-        if segment is not None:
-            keys.append(segment.group())
-            # Update the key to start searching from the next position
-            key = key[segment.end() :]
+        keys.append(key[segment[0] : segment[1]])
+        # Continue searching from the end of this segment
+        pos = segment[1]
 
     # If there's a remainder, just add whatever is left
     if segment is not None:
-        if options.strict_depth:
-            raise IndexError(f"Input depth exceeded depth option of {options.depth} and strict_depth is True")
-        keys.append(f"[{key[segment.start():]}]")
+        if strict_depth:
+            raise IndexError(f"Input depth exceeded depth option of {depth} and strict_depth is True")
+        keys.append(f"[{key[segment[0]:]}]")
 
-    return _parse_object(keys, val, options, values_parsed)
+    return tuple(keys)
+
+
+_split_key_into_segments_cached = lru_cache(maxsize=1024)(_split_key_into_segments)
+"""Cached ``_split_key_into_segments`` for short keys, which repeat often across query strings."""
+
+
+def _find_bracket_segment(key: str, start: int) -> t.Optional[t.Tuple[int, int]]:
+    """Find the first balanced bracket segment, e.g. ``[b]`` or ``[b[c]]``, at or after ``start``.
+
+    Returns the ``(start, end)`` slice bounds of the segment, or ``None`` if there is none.
+    """
+    open_pos: int = key.find("[", start)
+    if open_pos == -1:
+        return None
+
+    close_pos: int = key.find("]", open_pos + 1)
+    # Positions of the brackets that are still waiting for their closing bracket
+    pending: t.List[int] = []
+    found: t.Optional[t.Tuple[int, int]] = None
+
+    while close_pos != -1:
+        if open_pos != -1 and open_pos < close_pos:
+            pending.append(open_pos)
+            open_pos = key.find("[", open_pos + 1)
+            continue
+
+        if pending:
+            segment_start: int = pending.pop()
+            if not pending:
+                # Nothing opened before this bracket is left, so no segment can start earlier
+                return segment_start, close_pos + 1
+            if found is None or segment_start < found[0]:
+                found = (segment_start, close_pos + 1)
+
+        close_pos = key.find("]", close_pos + 1)
+
+    return found
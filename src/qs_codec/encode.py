@@ -11,7 +11,7 @@ from .enums.format import Format
 from .enums.list_format import ListFormat
 from .enums.sentinel import Sentinel
 from .models.encode_options import EncodeOptions
-from .models.undefined import Undefined
+from .models.undefined import UNDEFINED
 from .models.weak_wrapper import WeakWrapper
 from .utils.utils import Utils
 
@@ -29,7 +29,7 @@ def encode(value: t.Any, options: EncodeOptions = EncodeOptions()) -> str:
     if isinstance(value, t.Mapping):
         obj = deepcopy(value)
     elif isinstance(value, (list, tuple)):
-        obj = {str(key): value for key, value in enumerate(value)}
+        obj = {str(key): value for key, value in enumerate(deepcopy(value))}
     else:
         obj = {}
 
@@ -38,7 +38,7 @@ def encode(value: t.Any, options: EncodeOptions = EncodeOptions()) -> str:
     if not obj:
         return ""
 
-    obj_keys: t.Optional[t.List[t.Any]] = None
+    obj_keys: t.Optional[t.Sequence[t.Any]] = None
 
     if options.filter is not None:
         if callable(options.filter):
@@ -49,7 +49,7 @@ def encode(value: t.Any, options: EncodeOptions = EncodeOptions()) -> str:
     comma_round_trip: bool = options.list_format == ListFormat.COMMA and options.comma_round_trip is True
 
     if obj_keys is None:
-        obj_keys = list(obj.keys())
+        obj_keys = tuple(obj)
 
     if options.sort is not None and callable(options.sort):
         obj_keys = sorted(obj_keys, key=cmp_to_key(options.sort))
@@ -91,17 +91,22 @@ def encode(value: t.Any, options: EncodeOptions = EncodeOptions()) -> str:
             keys.append(_encoded)
 
     joined: str = options.delimiter.join(keys)
-    prefix: str = "?" if options.add_query_prefix else ""
+    parts: t.List[str] = ["?"] if options.add_query_prefix else []
 
     if options.charset_sentinel:
         if options.charset == Charset.LATIN1:
-            prefix += f"{Sentinel.ISO.encoded}&"
+            parts.append(f"{Sentinel.ISO.encoded}&")
         elif options.charset == Charset.UTF8:
-            prefix += f"{Sentinel.CHARSET.encoded}&"
+            parts.append(f"{Sentinel.CHARSET.encoded}&")
         else:
             raise ValueError("Invalid charset")
 
-    return prefix + joined if joined else ""
+    if not joined:
+        return ""
+
+    parts.append(joined)
+
+    return "".join(parts)
 
 
 _sentinel: WeakWrapper = WeakWrapper({})
@@ -138,7 +143,8 @@ def _encode(
     if formatter is None:
         formatter = format.formatter
 
-    obj: t.Any = deepcopy(value)
+    # ``encode`` deep-copies its input once, so nested values can be used as they are
+    obj: t.Any = value
 
     tmp_sc: t.Optional[WeakKeyDictionary] = side_channel
     step: int = 0
@@ -188,8 +194,17 @@ def _encode(
     if is_undefined:
         return values
 
-    obj_keys: t.List
-    if generate_array_prefix == ListFormat.COMMA.generator and isinstance(obj, (list, tuple)):
+    # Resolve the container kind once, exact type checks first as the typing ABC checks are comparatively slow
+    obj_type: t.Type = type(obj)
+    is_mapping: bool = obj_type is dict or (
+        obj_type is not list and obj_type is not tuple and isinstance(obj, t.Mapping)
+    )
+    is_sequence: bool = (
+        obj_type is list or obj_type is tuple or (obj_type is not dict and isinstance(obj, (list, tuple)))
+    )
+
+    obj_keys: t.Sequence
+    if generate_array_prefix == ListFormat.COMMA.generator and is_sequence:
         # we need to join elements in
         if encode_values_only and callable(encoder):
             obj = Utils.apply(obj, encoder)
@@ -198,44 +213,45 @@ def _encode(
             obj_keys_value = ",".join([str(e) if e is not None else "" for e in obj])
             obj_keys = [{"value": obj_keys_value if obj_keys_value else None}]
         else:
-            obj_keys = [{"value": Undefined()}]
+            obj_keys = [{"value": UNDEFINED}]
     elif isinstance(filter, (list, tuple)):
         obj_keys = list(filter)
     else:
-        keys: t.List
-        if isinstance(obj, t.Mapping):
-            keys = list(obj.keys())
-        elif isinstance(obj, (list, tuple)):
-            keys = [index for index in range(len(obj))]
+        keys: t.Sequence
+        if is_mapping:
+            keys = tuple(obj)
+        elif is_sequence:
+            keys = range(len(obj))
         else:
-            keys = []
+            keys = ()
 
-        obj_keys = sorted(keys, key=cmp_to_key(sort)) if sort is not None else list(keys)
+        obj_keys = sorted(keys, key=cmp_to_key(sort)) if sort is not None else keys
 
     encoded_prefix: str = prefix.replace(".", "%2E") if encode_dot_in_keys else prefix
 
     adjusted_prefix: str = (
-        f"{encoded_prefix}[]"
-        if comma_round_trip and isinstance(obj, (list, tuple)) and len(obj) == 1
-        else encoded_prefix
+        f"{encoded_prefix}[]" if comma_round_trip and is_sequence and len(obj) == 1 else encoded_prefix
     )
 
-    if allow_empty_lists and isinstance(obj, (list, tuple)) and not obj:
+    if allow_empty_lists and is_sequence and not obj:
         return [f"{adjusted_prefix}[]"]
 
+    # Registering the value with the side channel hashes the whole subtree, so do it once per level, not per key
+    value_registered: bool = False
+
     for _key in obj_keys:
         _value: t.Any
         _value_undefined: bool
 
-        if isinstance(_key, t.Mapping) and "value" in _key and not isinstance(_key.get("value"), Undefined):
+        if isinstance(_key, dict) and "value" in _key and _key.get("value") is not UNDEFINED:
             _value = _key.get("value")
             _value_undefined = False
         else:
             try:
-                if isinstance(obj, t.Mapping):
+                if is_mapping:
                     _value = obj.get(_key)
                     _value_undefined = _key not in obj
-                elif isinstance(obj, (list, tuple)):
+                elif is_sequence:
                     _value = obj[_key]
                     _value_undefined = False
                 else:
@@ -252,11 +268,13 @@ def _encode(
 
         key_prefix: str = (
             generate_array_prefix(adjusted_prefix, encoded_key)
-            if isinstance(obj, (list, tuple))
+            if is_sequence
             else f"{adjusted_prefix}{f'.{encoded_key}' if allow_dots else f'[{encoded_key}]'}"
         )
 
-        side_channel[WeakWrapper(value)] = step
+        if not value_registered:
+            side_channel[WeakWrapper(value)] = step
+            value_registered = True
         value_side_channel: WeakKeyDictionary = WeakKeyDictionary()
         value_side_channel[_sentinel] = side_channel
 
@@ -268,9 +286,7 @@ def _encode(
             comma_round_trip=comma_round_trip,
             encoder=(
                 None
-                if generate_array_prefix == ListFormat.COMMA.generator
-                and encode_values_only
-                and isinstance(obj, (list, tuple))
+                if generate_array_prefix == ListFormat.COMMA.generator and encode_values_only and is_sequence
                 else encoder
             ),
             serialize_date=serialize_date,
@@ -11,3 +11,7 @@ class Undefined:
         if cls._instance is None:
             cls._instance = super(Undefined, cls).__new__(cls)
         return cls._instance
+
+
+UNDEFINED: Undefined = Undefined()
+"""The ``Undefined`` singleton. Every ``Undefined()`` call returns this instance, so it can be compared with ``is``."""
@@ -27,9 +27,13 @@ class WeakWrapper:
         if depth > max_depth:
             raise ValueError("Maximum recursion depth exceeded")
 
-        if isinstance(value, t.Mapping):
+        result: t.Any
+        # Exact built-in type checks come first, the typing ABC check is only needed for other mappings
+        if isinstance(value, dict) or (
+            not isinstance(value, (str, int, float, list, set)) and isinstance(value, t.Mapping)
+        ):
             result = tuple((k, self._hash_recursive(v, seen, stack, depth + 1)) for k, v in sorted(value.items()))
-        elif isinstance(value, (t.List, t.Set)):
+        elif isinstance(value, (list, set)):
             result = tuple(self._hash_recursive(v, seen, stack, depth + 1) for v in value)
         else:
             result = value
@@ -5,12 +5,19 @@ import typing as t
 from urllib.parse import unquote
 
 from ..enums.charset import Charset
-from .str_utils import code_unit_at
 
 
 class DecodeUtils:
     """A collection of decode utility methods used by the library."""
 
+    HEX_ESCAPE_PATTERN: t.Pattern[str] = re.compile(r"%[0-9a-f]{2}", re.IGNORECASE)
+    """Matches a single percent-encoded byte, e.g. ``%E4``"""
+
+    HEX_ESCAPE_TABLE: t.Dict[str, str] = {
+        f"%{hi}{lo}": chr(int(hi + lo, 16)) for hi in "0123456789abcdefABCDEF" for lo in "0123456789abcdefABCDEF"
+    }
+    """Maps every percent-encoded byte, in any letter case, to its Latin-1 character"""
+
     @classmethod
     def unescape(cls, string: str) -> str:
         """A Python representation the deprecated JavaScript unescape function.
@@ -21,22 +28,26 @@ class DecodeUtils:
 
         i: int = 0
         while i < len(string):
-            c: int = code_unit_at(string, i)
-
-            if c == 0x25:
-                if string[i + 1] == "u":
-                    buffer.append(
-                        chr(int(string[i + 2 : i + 6], 16)),
-                    )
-                    i += 6
-                    continue
-
-                buffer.append(chr(int(string[i + 1 : i + 3], 16)))
-                i += 3
+            # Copy everything up to the next escape in one slice rather than character by character
+            pos: int = string.find("%", i)
+            if pos == -1:
+                buffer.append(string[i:])
+                break
+
+            if pos > i:
+                buffer.append(string[i:pos])
+
+            if string[pos + 1] == "u":
+                buffer.append(
+                    chr(int(string[pos + 2 : pos + 6], 16)),
+                )
+                i = pos + 6
                 continue
 
-            buffer.append(string[i])
-            i += 1
+            # Well-formed escapes come straight from the table, anything else is left to int() as before
+            char: t.Optional[str] = cls.HEX_ESCAPE_TABLE.get(string[pos : pos + 3])
+            buffer.append(char if char is not None else chr(int(string[pos + 1 : pos + 3], 16)))
+            i = pos + 3
 
         return "".join(buffer)
 
@@ -50,14 +61,16 @@ class DecodeUtils:
         if string is None:
             return None
 
+        # Nothing to decode, which is the common case for plain keys and values
+        if "%" not in string and "+" not in string:
+            return string
+
         string_without_plus: str = string.replace("+", " ")
 
         if charset == Charset.LATIN1:
-            return re.sub(
-                r"%[0-9a-f]{2}",
-                lambda match: cls.unescape(match.group(0)),
+            return cls.HEX_ESCAPE_PATTERN.sub(
+                lambda match: cls.HEX_ESCAPE_TABLE[match.group(0)],
                 string_without_plus,
-                flags=re.IGNORECASE,
             )
 
         return unquote(string_without_plus)
@@ -5,6 +5,7 @@ import typing as t
 from datetime import datetime
 from decimal import Decimal
 from enum import Enum
+from urllib.parse import quote
 
 from ..enums.charset import Charset
 from ..enums.format import Format
@@ -91,57 +92,9 @@ class EncodeUtils:
                 flags=re.IGNORECASE,
             )
 
-        buffer: t.List[str] = []
-
-        i: int
-        for i, _ in enumerate(string):
-            c: int = code_unit_at(string, i)
-
-            if (
-                c == 0x2D  # -
-                or c == 0x2E  # .
-                or c == 0x5F  # _
-                or c == 0x7E  # ~
-                or (0x30 <= c <= 0x39)  # 0-9
-                or (0x41 <= c <= 0x5A)  # a-z
-                or (0x61 <= c <= 0x7A)  # A-Z
-                or (format == Format.RFC1738 and (c == 0x28 or c == 0x29))  # ( )
-            ):
-                buffer.append(string[i])
-                continue
-            elif c < 0x80:  # ASCII
-                buffer.extend([cls.HEX_TABLE[c]])
-                continue
-            elif c < 0x800:  # 2 bytes
-                buffer.extend(
-                    [
-                        cls.HEX_TABLE[0xC0 | (c >> 6)],
-                        cls.HEX_TABLE[0x80 | (c & 0x3F)],
-                    ],
-                )
-                continue
-            elif c < 0xD800 or c >= 0xE000:  # 3 bytes
-                buffer.extend(
-                    [
-                        cls.HEX_TABLE[0xE0 | (c >> 12)],
-                        cls.HEX_TABLE[0x80 | ((c >> 6) & 0x3F)],
-                        cls.HEX_TABLE[0x80 | (c & 0x3F)],
-                    ],
-                )
-                continue
-            else:
-                i += 1
-                c = 0x10000 + (((c & 0x3FF) << 10) | (code_unit_at(string, i) & 0x3FF))
-                buffer.extend(
-                    [
-                        cls.HEX_TABLE[0xF0 | (c >> 18)],
-                        cls.HEX_TABLE[0x80 | ((c >> 12) & 0x3F)],
-                        cls.HEX_TABLE[0x80 | ((c >> 6) & 0x3F)],
-                        cls.HEX_TABLE[0x80 | (c & 0x3F)],
-                    ],
-                )
-
-        return "".join(buffer)
+        # urllib's quote leaves exactly the RFC 3986 unreserved characters (A-Z a-z 0-9 - . _ ~) unencoded and
+        # percent-encodes everything else as upper-case UTF-8 octets, just like encodeURIComponent.
+        return quote(string, safe="()" if format == Format.RFC1738 else "")
 
     @staticmethod
     def serialize_date(dt: datetime) -> str:
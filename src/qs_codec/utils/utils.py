@@ -1,13 +1,20 @@
 """A collection of utility methods used by the library."""
 
-import copy
 import typing as t
+from collections import deque
 from datetime import datetime, timedelta
 from decimal import Decimal
 from enum import Enum
 
 from ..models.decode_options import DecodeOptions
-from ..models.undefined import Undefined
+from ..models.undefined import UNDEFINED
+
+
+_PRIMITIVE_TYPES: t.FrozenSet[t.Type] = frozenset({int, float, bool, Decimal, datetime, timedelta})
+"""Exact types that are always considered non-nullish primitives."""
+
+_DEFAULT_DECODE_OPTIONS: DecodeOptions = DecodeOptions()
+"""Shared default options, ``merge`` only ever reads from them."""
 
 
 class Utils:
@@ -17,181 +24,163 @@ class Utils:
     def merge(
         target: t.Optional[t.Union[t.Mapping[str, t.Any], t.List[t.Any], t.Tuple]],
         source: t.Optional[t.Union[t.Mapping[str, t.Any], t.List[t.Any], t.Tuple, t.Any]],
-        options: DecodeOptions = DecodeOptions(),
+        options: t.Optional[DecodeOptions] = None,
     ) -> t.Union[t.Dict[str, t.Any], t.List, t.Tuple, t.Any]:
         """Merge two objects together."""
         if source is None:
             return target
 
+        if options is None:
+            options = _DEFAULT_DECODE_OPTIONS
+
+        if type(target) is dict and type(source) is dict:
+            return Utils._merge_mappings(target, source, options)
+
         if not isinstance(source, t.Mapping):
             if isinstance(target, (list, tuple)):
-                if any(isinstance(el, Undefined) for el in target):
-                    target_: t.Dict[int, t.Any] = dict(enumerate(target))
+                if any(el is UNDEFINED for el in target):
+                    target_: t.List[t.Any] = list(target)
+                    target_length: int = len(target_)
+                    # Items past the end of the target keep their original index in case the result becomes a dict
+                    overflow: t.List[t.Tuple[int, t.Any]] = []
 
                     if isinstance(source, (list, tuple)):
                         for i, item in enumerate(source):
-                            if not isinstance(item, Undefined):
-                                target_[i] = item
+                            if item is not UNDEFINED:
+                                if i < target_length:
+                                    target_[i] = item
+                                else:
+                                    overflow.append((i, item))
                     else:
-                        target_[len(target_)] = source
+                        overflow.append((target_length, source))
 
-                    if any(isinstance(value, Undefined) for value in target_.values()):
-                        target = {str(i): target_[i] for i in target_ if not isinstance(target_[i], Undefined)}
+                    if any(value is UNDEFINED for value in target_) or any(item is UNDEFINED for _, item in overflow):
+                        target = {str(i): el for i, el in enumerate(target_) if el is not UNDEFINED}
+                        target.update((str(i), item) for i, item in overflow if item is not UNDEFINED)
                     else:
-                        target = list(filter(lambda el: not isinstance(el, Undefined), target_.values()))
+                        target = target_
+                        target.extend(item for _, item in overflow)
                 else:
                     if isinstance(source, (list, tuple)):
-                        if all((isinstance(el, t.Mapping) or isinstance(el, Undefined)) for el in target) and all(
-                            (isinstance(el, t.Mapping) or isinstance(el, Undefined)) for el in source
+                        if all((el is UNDEFINED or isinstance(el, t.Mapping)) for el in target) and all(
+                            (el is UNDEFINED or isinstance(el, t.Mapping)) for el in source
                         ):
-                            target__: t.Dict[int, t.Any] = dict(enumerate(target))
-                            target = list(
-                                {
-                                    i: Utils.merge(target__[i], item, options) if i in target__ else item
-                                    for i, item in enumerate(source)
-                                }.values()
-                            )
+                            target_length_: int = len(target)
+                            target = [
+                                Utils.merge(target[i], item, options) if i < target_length_ else item
+                                for i, item in enumerate(source)
+                            ]
                         else:
-                            if isinstance(target, tuple):
-                                target = list(target)
-                            target.extend(filter(lambda el: not isinstance(el, Undefined), source))
+                            target = [*target, *[el for el in source if el is not UNDEFINED]]
                     elif source is not None:
-                        if isinstance(target, tuple):
-                            target = list(target)
+                        target = list(target)
                         target.append(source)
             elif isinstance(target, t.Mapping):
                 if isinstance(source, (list, tuple)):
-                    target = {
-                        **target,
-                        **{str(i): item for i, item in enumerate(source) if not isinstance(item, Undefined)},
-                    }
+                    target_dict: t.Dict[str, t.Any] = dict(target)
+                    for i, item in enumerate(source):
+                        if item is not UNDEFINED:
+                            target_dict[str(i)] = item
+                    target = target_dict
             elif source is not None:
                 if not isinstance(target, (list, tuple)) and isinstance(source, (list, tuple)):
-                    return [target, *filter(lambda el: not isinstance(el, Undefined), source)]
+                    return [target, *[el for el in source if el is not UNDEFINED]]
                 return [target, source]
 
             return target
 
         if target is None or not isinstance(target, t.Mapping):
             if isinstance(target, (list, tuple)):
-                return {
-                    **{str(i): item for i, item in enumerate(target) if not isinstance(item, Undefined)},
-                    **source,
-                }
-
-            return [
-                el
-                for el in (target if isinstance(target, (list, tuple)) else [target])
-                if not isinstance(el, Undefined)
-            ] + [
-                el
-                for el in (source if isinstance(source, (list, tuple)) else [source])
-                if not isinstance(el, Undefined)
+                mapped: t.Dict[str, t.Any] = {str(i): item for i, item in enumerate(target) if item is not UNDEFINED}
+                mapped.update(source)
+                return mapped
+
+            return [el for el in (target if isinstance(target, (list, tuple)) else [target]) if el is not UNDEFINED] + [
+                el for el in (source if isinstance(source, (list, tuple)) else [source]) if el is not UNDEFINED
             ]
 
-        merge_target: t.Dict[str, t.Any] = (
-            {str(i): el for i, el in enumerate(source) if not isinstance(el, Undefined)}
-            if isinstance(target, (list, tuple)) and not isinstance(source, (list, tuple))
-            else copy.deepcopy(dict(target) if not isinstance(target, dict) else target)
-        )
+        return Utils._merge_mappings(target, source, options)
 
-        return {
-            **merge_target,
-            **{
-                str(key): Utils.merge(merge_target[key], value, options) if key in merge_target else value
-                for key, value in source.items()
-            },
-        }
+    @staticmethod
+    def _merge_mappings(
+        target: t.Mapping[str, t.Any],
+        source: t.Mapping[str, t.Any],
+        options: DecodeOptions,
+    ) -> t.Dict[str, t.Any]:
+        """Merge two mappings, recursing directly on nested ``dict`` pairs without going through ``merge``."""
+        merge_target: t.Dict[str, t.Any] = dict(target)
+
+        for key, value in source.items():
+            if key not in merge_target:
+                merge_target[str(key)] = value
+                continue
+
+            existing: t.Any = merge_target[key]
+            merge_target[str(key)] = (
+                Utils._merge_mappings(existing, value, options)
+                if type(existing) is dict and type(value) is dict
+                else Utils.merge(existing, value, options)
+            )
+
+        return merge_target
 
     @staticmethod
     def compact(value: t.Dict[str, t.Any]) -> t.Dict[str, t.Any]:
         """Remove all `Undefined` values from a dictionary."""
-        queue: t.List[t.Dict[str, t.Any]] = [{"obj": {"o": value}, "prop": "o"}]
-        refs: t.List = []
-
-        for i in range(len(queue)):  # pylint: disable=C0200
-            item: t.Mapping = queue[i]
-            obj: t.Mapping = item["obj"][item["prop"]]
-
-            keys: t.List = list(obj.keys())
-            for key in keys:
-                val = obj.get(key)
-
-                if (
-                    val is not None
-                    and not isinstance(val, Undefined)
-                    and isinstance(val, t.Mapping)
-                    and val not in refs
-                ):
-                    queue.append({"obj": obj, "prop": key})
-                    refs.append(val)
-
         Utils._remove_undefined_from_map(value)
 
         return value
 
-    @staticmethod
-    def _remove_undefined_from_list(value: t.List) -> None:
-        i: int = len(value) - 1
-        while i >= 0:
-            item = value[i]
-            if isinstance(item, Undefined):
-                value.pop(i)
-            elif isinstance(item, dict):
-                Utils._remove_undefined_from_map(item)
-            elif isinstance(item, list):
-                Utils._remove_undefined_from_list(item)
-            elif isinstance(item, tuple):
-                value[i] = list(item)
-                Utils._remove_undefined_from_list(value[i])
-            i -= 1
-
     @staticmethod
     def _remove_undefined_from_map(obj: t.Dict) -> None:
-        keys: t.List = list(obj.keys())
-        for key in keys:
-            val = obj[key]
-            if isinstance(val, Undefined):
-                obj.pop(key)
-            elif isinstance(val, dict) and not Utils._dicts_are_equal(val, obj):
-                Utils._remove_undefined_from_map(val)
-            elif isinstance(val, list):
-                Utils._remove_undefined_from_list(val)
-            elif isinstance(val, tuple):
-                obj[key] = list(val)
-                Utils._remove_undefined_from_list(obj[key])
-
-    @staticmethod
-    def _dicts_are_equal(d1: t.Mapping, d2: t.Mapping, path=None) -> bool:
-        if path is None:
-            path = set()
-
-        if id(d1) in path or id(d2) in path:
-            return True
-
-        path.add(id(d1))
-        path.add(id(d2))
-
-        if isinstance(d1, dict) and isinstance(d2, dict):
-            if len(d1) != len(d2):
-                return False
-            for k, v in d1.items():
-                if k not in d2:
-                    return False
-                if not Utils._dicts_are_equal(v, d2[k], path):
-                    return False
-            return True
-        else:
-            return d1 == d2
+        # Walk nested dicts and lists with an explicit stack so that deeply nested (and possibly attacker controlled)
+        # input can not exhaust the recursion limit. Visited container ids guard against circular references.
+        visited: t.Set[int] = set()
+        stack: t.Deque[t.Union[t.Dict, t.List]] = deque([obj])
+
+        while stack:
+            container: t.Union[t.Dict, t.List] = stack.pop()
+            if id(container) in visited:
+                continue
+            visited.add(id(container))
+
+            if isinstance(container, dict):
+                undefined_keys: t.List = [key for key, val in container.items() if val is UNDEFINED]
+                for key in undefined_keys:
+                    del container[key]
+
+                # Only values are replaced from here on, so the dict can be iterated directly
+                for key, val in container.items():
+                    if isinstance(val, (dict, list)):
+                        stack.append(val)
+                    elif isinstance(val, tuple):
+                        container[key] = list(val)
+                        stack.append(container[key])
+            else:
+                i: int = len(container) - 1
+                while i >= 0:
+                    item = container[i]
+                    if item is UNDEFINED:
+                        container.pop(i)
+                    elif isinstance(item, (dict, list)):
+                        stack.append(item)
+                    elif isinstance(item, tuple):
+                        container[i] = list(item)
+                        stack.append(container[i])
+                    i -= 1
 
     @staticmethod
     def combine(a: t.Union[list, tuple, t.Any], b: t.Union[list, tuple, t.Any]) -> t.List:
         """Combine two lists or values."""
+        if type(a) is list and type(b) is list:
+            return a + b
         return [*(a if isinstance(a, (list, tuple)) else [a]), *(b if isinstance(b, (list, tuple)) else [b])]
 
     @staticmethod
     def apply(val: t.Union[list, tuple, t.Any], fn: t.Callable) -> t.Union[t.List, t.Any]:
         """Apply a function to a value or a list of values."""
+        if type(val) is list:
+            return [fn(item) for item in val]
         return [fn(item) for item in val] if isinstance(val, (list, tuple)) else fn(val)
 
     @staticmethod
@@ -200,13 +189,23 @@ class Utils:
         if val is None:
             return False
 
+        val_type: t.Type = type(val)
+        if val_type is str:
+            return val != "" if skip_nulls else True
+
+        if val_type in _PRIMITIVE_TYPES:
+            return True
+
+        if val_type is dict or val_type is list or val_type is tuple:
+            return False
+
         if isinstance(val, str):
             return val != "" if skip_nulls else True
 
         if isinstance(val, (int, float, Decimal, bool, Enum, datetime, timedelta)):
             return True
 
-        if isinstance(val, Undefined):
+        if val is UNDEFINED:
             return False
 
         if isinstance(val, object):
@@ -2,11 +2,12 @@ import re
 import typing as t
 from contextlib import nullcontext as does_not_raise
 from datetime import datetime
-from sys import getsizeof
 
 import pytest
 
 from qs_codec import Charset, DecodeOptions, Duplicates, decode
+from qs_codec.decode import _split_key_into_segments_cached
+from qs_codec.models.undefined import Undefined
 from qs_codec.utils.decode_utils import DecodeUtils
 
 
@@ -318,11 +319,15 @@ class TestDecode:
         assert decode("[]&a=b", DecodeOptions(strict_null_handling=True)) == {"0": None, "a": "b"}
         assert decode("[foo]=bar") == {"foo": "bar"}
 
+    def test_parses_nested_and_unbalanced_brackets_in_keys(self) -> None:
+        assert decode("a[b[c]]=d") == {"a": {"b[c]": "d"}}
+        assert decode("a[b[c]=d") == {"a[b": {"c": "d"}}
+        assert decode("a[[b]=c") == {"a[": {"b": "c"}}
+        assert decode("a[b]x[c]=d") == {"a": {"b": {"c": "d"}}}
+        assert decode("[[a]]=b") == {"[a]": "b"}
+
     def test_does_not_error_when_parsing_a_very_long_list(self) -> None:
-        buf: str = "a[]=a"
-        while getsizeof(buf) < 128 * 1024:
-            buf += "&"
-            buf += buf
+        buf: str = "&".join(["a[]=a"] * (128 * 1024 // len("a[]=a&") + 1))
 
         with does_not_raise():
             assert decode(buf) is not None
@@ -430,15 +435,14 @@ class TestDecode:
         assert "bar" in parsed["foo"]
         assert "baz" in parsed["foo"]
         assert parsed["foo"]["bar"] == "baz"
-        assert parsed["foo"]["baz"] == a
+        # The input is copied, so the result holds an equivalent circular dict rather than ``a`` itself
+        assert parsed["foo"]["baz"] is not a
+        assert parsed["foo"]["baz"]["b"] is parsed["foo"]["baz"]
 
     def test_does_not_crash_when_parsing_deep_dicts(self) -> None:
         depth: int = 5000
 
-        string: str = "foo"
-        for _ in range(depth):
-            string += "[p]"
-        string += "=bar"
+        string: str = "foo" + "[p]" * depth + "=bar"
 
         parsed: t.Optional[t.Mapping]
 
@@ -461,6 +465,25 @@ class TestDecode:
         assert decode(a) == {"b": "c"}
         assert decode({"a": a}) == {"a": a}
 
+    def test_returns_tuples_in_a_dict_input_as_lists(self) -> None:
+        assert decode({"a": ("x", "y")}) == {"a": ["x", "y"]}
+        assert decode({"a": ("x", {"b": "1"})}) == {"a": ["x", {"b": "1"}]}
+        assert isinstance(decode({"a": ("x", "y")})["a"], list)
+        assert isinstance(decode({"a": ("x", {"b": "1"})})["a"], list)
+
+    def test_does_not_mutate_a_dict_input(self) -> None:
+        value: t.Dict[str, t.Any] = {
+            "a": {"b": [Undefined(), "x"]},
+            "c": {"d": ("x", {"e": "1"})},
+            "z": "1",
+        }
+        decode(value)
+        assert value == {
+            "a": {"b": [Undefined(), "x"]},
+            "c": {"d": ("x", {"e": "1"})},
+            "z": "1",
+        }
+
     def test_parses_dates_correctly(self) -> None:
         now: datetime = datetime.now()
         assert decode({"a": now}) == {"a": now}
@@ -503,12 +526,7 @@ class TestDecode:
                 return None
 
             reg: re.Pattern = re.compile(r"%([0-9A-F]{2})", re.IGNORECASE)
-            result: t.List[int] = []
-            parts: t.Optional[re.Match]
-            while (parts := reg.search(s)) is not None:
-                result.append(int(parts.group(1), 16))
-                s = s[parts.end() :]
-            return bytes(result).decode("shift-jis")
+            return bytes.fromhex("".join(parts.group(1) for parts in reg.finditer(s))).decode("shift-jis")
 
         assert decode("%8c%a7=%91%e5%8d%e3%95%7b", DecodeOptions(decoder=_decode)) == {"県": "大阪府"}
 
@@ -648,6 +666,16 @@ class TestDuplicatesOption:
     def test_first(self) -> None:
         assert decode("foo=bar&foo=baz", DecodeOptions(duplicates=Duplicates.FIRST)) == {"foo": "bar"}
 
+    def test_first_does_not_decode_ignored_values(self) -> None:
+        decoded: t.List[t.Optional[str]] = []
+
+        def _decoder(s: t.Optional[str], charset: t.Optional[Charset]) -> t.Any:
+            decoded.append(s)
+            return DecodeUtils.decode(s, charset=charset)
+
+        assert decode("foo=bar&foo=baz", DecodeOptions(duplicates=Duplicates.FIRST, decoder=_decoder)) == {"foo": "bar"}
+        assert "baz" not in decoded
+
     def test_last(self) -> None:
         assert decode("foo=bar&foo=baz", DecodeOptions(duplicates=Duplicates.LAST)) == {"foo": "baz"}
 
@@ -687,6 +715,21 @@ class TestStrictDepthOption:
     def test_does_not_throw_when_depth_is_exactly_at_the_limit_with_strict_depth_true(self) -> None:
         assert decode("a[b][c]=d", DecodeOptions(depth=2, strict_depth=True)) == {"a": {"b": {"c": "d"}}}
 
+    def test_repeated_keys_honour_the_options_of_each_call(self) -> None:
+        for _ in range(2):
+            with pytest.raises(IndexError):
+                decode("a[b][c]=d", DecodeOptions(depth=1, strict_depth=True))
+            assert decode("a[b][c]=d", DecodeOptions(depth=1)) == {"a": {"b": {"[c]": "d"}}}
+            assert decode("a[b][c]=d", DecodeOptions(depth=2, strict_depth=True)) == {"a": {"b": {"c": "d"}}}
+
+    def test_only_caches_the_segments_of_short_keys(self) -> None:
+        _split_key_into_segments_cached.cache_clear()
+        long_key: str = "a" * 300 + "[b]"
+        assert decode(f"{long_key}=c") == {"a" * 300: {"b": "c"}}
+        assert _split_key_into_segments_cached.cache_info().currsize == 0
+        assert decode("a[b]=c") == {"a": {"b": "c"}}
+        assert _split_key_into_segments_cached.cache_info().currsize == 1
+
 
 class TestParameterList:
     def test_does_not_raise_error_when_within_parameter_limit(self) -> None:
@@ -631,6 +631,23 @@ class TestEncode:
         assert encode(obj, options=EncodeOptions(filter=filter_func)) == "a=b&c=&e%5Bf%5D=1257894000"
         assert calls == 5
 
+    def test_filter_function_does_not_mutate_the_input(self) -> None:
+        def filter_func(prefix: str, value: t.Any) -> t.Any:
+            if isinstance(value, dict):
+                value.pop("secret", None)
+            return value
+
+        dict_input: t.Dict[str, t.Any] = {"a": {"b": "1", "secret": "s"}}
+        list_input: t.List[t.Any] = [{"a": "1", "secret": "s"}]
+        tuple_input: t.Tuple[t.Any, ...] = ({"a": "1", "secret": "s"},)
+
+        assert encode(dict_input, options=EncodeOptions(filter=filter_func)) == "a%5Bb%5D=1"
+        assert encode(list_input, options=EncodeOptions(filter=filter_func)) == "0%5Ba%5D=1"
+        assert encode(tuple_input, options=EncodeOptions(filter=filter_func)) == "0%5Ba%5D=1"
+        assert dict_input == {"a": {"b": "1", "secret": "s"}}
+        assert list_input == [{"a": "1", "secret": "s"}]
+        assert tuple_input == ({"a": "1", "secret": "s"},)
+
     def test_can_disable_uri_encoding(self) -> None:
         assert encode({"a": "b"}, options=EncodeOptions(encode=False)) == "a=b"
         assert encode({"a": {"b": "c"}}, options=EncodeOptions(encode=False)) == "a[b]=c"
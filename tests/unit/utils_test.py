@@ -319,6 +319,7 @@ class TestUtils:
             ("foo bar", "foo%20bar", None),
             ("foo(bar)", "foo%28bar%29", None),
             ("foo(bar)", "foo(bar)", Format.RFC1738),
+            ("foo\U0001F600bar\U0001F600", "foo%F0%9F%98%80bar%F0%9F%98%80", None),
             ([1, 2], "", None),
             ({"a": "b"}, "", None),
             (("a", "b"), "", None),
@@ -470,6 +471,13 @@ class TestUtils:
             {"foo": ["xyzzy"]},
         ) == {"foo": {"bar": "baz", "0": "xyzzy"}}
 
+    def test_merge_does_not_mutate_target(self) -> None:
+        target = {"foo": ["bar"], "baz": {"qux": "quux"}}
+        merged = Utils.merge(target, {"foo": ["xyzzy"], "baz": {"corge": "grault"}})
+
+        assert merged == {"foo": ["bar", "xyzzy"], "baz": {"qux": "quux", "corge": "grault"}}
+        assert target == {"foo": ["bar"], "baz": {"qux": "quux"}}
+
     def test_combine_both_arrays(self) -> None:
         a = [1]
         b = [2]
@@ -546,3 +554,50 @@ class TestUtils:
                 "c": "c",
             },
         }
+
+    def test_compact_handles_circular_references(self) -> None:
+        a: t.Dict[str, t.Any] = {"b": {"c": Undefined()}, "d": [Undefined(), "e"]}
+        a["b"]["a"] = a
+        a["d"].append(a)
+
+        compacted = Utils.compact(a)
+
+        assert compacted is a
+        assert a["b"] == {"a": a}
+        assert a["d"] == ["e", a]
+
+    def test_remove_undefined_converts_tuples_to_lists(self) -> None:
+        map_with_tuples: t.Dict[str, t.Any] = {"a": ("a", "b"), "b": ("c", Undefined(), "d")}
+
+        Utils._remove_undefined_from_map(map_with_tuples)
+
+        assert map_with_tuples == {"a": ["a", "b"], "b": ["c", "d"]}
+
+    def test_compact_removes_undefined_from_deeply_nested_dicts(self) -> None:
+        depth: int = 5000
+        value: t.Dict[str, t.Any] = {"b": Undefined(), "c": "d"}
+        for _ in range(depth):
+            value = {"a": value}
+
+        Utils.compact(value)
+
+        ref: t.Dict[str, t.Any] = value
+        for _ in range(depth):
+            ref = ref["a"]
+
+        assert ref == {"c": "d"}
+
+    def test_compact_removes_undefined_from_deeply_nested_lists(self) -> None:
+        depth: int = 5000
+        value: t.List[t.Any] = [Undefined(), "a"]
+        for _ in range(depth):
+            value = [value, Undefined()]
+
+        compacted = Utils.compact({"a": value})
+
+        ref: t.List[t.Any] = compacted["a"]
+        for _ in range(depth):
+            assert len(ref) == 1
+            ref = ref[0]
+
+        assert ref == ["a"]